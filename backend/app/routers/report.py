@@ -5,10 +5,12 @@ Exposes endpoints for generating machine vibration analysis reports.
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 from typing import Optional
 import logging
 from datetime import datetime
+import orjson
 
 # Import report service
 try:
@@ -38,6 +40,26 @@ except ImportError:
 
 router = APIRouter()
 
+# Bytes per chunk when streaming a generated PDF
+PDF_CHUNK_SIZE = 64 * 1024
+
+# orjson options for JSON endpoints: ndarrays/NumPy scalars are written directly
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_response(content) -> Response:
+    """
+    Serialize content with orjson in one C-level pass.
+
+    Returning a Response skips FastAPI's jsonable_encoder walk over every
+    spectrum point. Anything orjson can't encode natively (e.g. ObjectId)
+    falls back to str().
+    """
+    return Response(
+        content=orjson.dumps(content, default=str, option=ORJSON_OPTIONS),
+        media_type="application/json"
+    )
+
 
 async def fetch_machine_from_db(machine_id: str) -> Optional[dict]:
     """Fetch machine from MongoDB."""
@@ -107,7 +129,7 @@ async def get_report_data(
             data_type=data_type
         )
         
-        return report_data
+        return orjson_response(report_data)
         
     except Exception as e:
         logging.exception(f"Failed to get report data for {machine_id}")
@@ -147,6 +169,9 @@ async def generate_pdf(
         if not bearings:
             bearings = await fetch_bearings_for_machine(machine_id)
         
+        # One timestamp for the report header and the filename
+        now = datetime.now()
+        
         # Generate PDF
         pdf_buffer = await generate_report(
             machine_id=machine_id,
@@ -155,7 +180,8 @@ async def generate_pdf(
             bearing_id=bearing_id,
             machine_class=machine_class,
             data_type=data_type,
-            include_charts=include_charts
+            include_charts=include_charts,
+            now=now
         )
         
         # Create filename
@@ -165,15 +191,17 @@ async def generate_pdf(
         
         # Clean filename
         safe_name = "".join(c for c in machine_name if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
-        date_str = datetime.now().strftime('%Y-%m-%d')
+        date_str = now.strftime('%Y-%m-%d')
         filename = f"Report_{safe_name}_{date_str}.pdf"
         
+        # Stream the (possibly disk-backed) buffer in chunks, then close it
         return StreamingResponse(
-            pdf_buffer,
+            iter(lambda: pdf_buffer.read(PDF_CHUNK_SIZE), b''),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
-            }
+            },
+            background=BackgroundTask(pdf_buffer.close)
         )
         
     except Exception as e:
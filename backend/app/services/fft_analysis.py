@@ -10,12 +10,13 @@ Signal processing functions are imported from rnsit_fft module.
 import numpy as np
 import math
 from scipy import signal
-import scipy.integrate
-from typing import Dict, List, Optional, Tuple, Any
+import scipy.fft
+from typing import Dict, List, Optional, Tuple, Any, Union
 import logging
 
 # Import ALL signal processing functions from RNSIT FFT module
 try:
+    from app.services import rnsit_fft
     from app.services.rnsit_fft import (
         butter_highpass,
         butter_highpass_filter,
@@ -25,6 +26,7 @@ try:
         Acceleration_Convert_32_DEMO
     )
 except ImportError:
+    from services import rnsit_fft
     from services.rnsit_fft import (
         butter_highpass,
         butter_highpass_filter,
@@ -102,12 +104,14 @@ def velocity_convert(rawData: List[float],
                      floorNoiseThresholdPercentage: Optional[float] = None,
                      floorNoiseAttenuationFactor: Optional[float] = None,
                      highResolution: int = 1,
-                     calibrationValue: float = 1.0) -> Dict[str, Any]:
+                     calibrationValue: float = 1.0,
+                     includeTimeseries: bool = True) -> Dict[str, Any]:
     """
     Wrapper function that uses RNSIT FFT implementation for velocity conversion.
     
     Converts acceleration data to velocity and computes FFT using the 
     Velocity_Convert_24_DEMO function from rnsit_fft module.
+    Thread-safe: per-axis analyses may run concurrently in a thread pool.
     
     Args:
         rawData: Raw acceleration data (in g)
@@ -119,9 +123,13 @@ def velocity_convert(rawData: List[float],
         floorNoiseAttenuationFactor: Factor to divide noise by (optional)
         highResolution: Resolution multiplier (default 1)
         calibrationValue: Calibration multiplier (default 1.0)
+        includeTimeseries: Compute the velocity timeseries (TWF); when False,
+            'Timeseries' is empty and twf_min/twf_max are None
         
     Returns:
-        Dict with SR, Timeseries data, FFT data, and frequency ranges
+        Dict with SR, Timeseries data, FFT data, and frequency ranges.
+        The FFT is also exposed as ndarrays under the private keys
+        '_freqs_arr' and '_amps_arr' for in-process analysis.
     """
     return Velocity_Convert_24_DEMO(
         rawData=rawData,
@@ -133,7 +141,8 @@ def velocity_convert(rawData: List[float],
         floorNoiseThresholdPercentage=floorNoiseThresholdPercentage,
         floorNoiseAttenuationFactor=floorNoiseAttenuationFactor,
         highResolution=highResolution,
-        calibrationValue=calibrationValue
+        calibrationValue=calibrationValue,
+        includeTimeseries=includeTimeseries
     )
 
 
@@ -143,6 +152,7 @@ def acceleration_convert(Data: List[float], SR: float, fmax: Optional[float] = N
     
     Processes acceleration data and computes FFT using the 
     Acceleration_Convert_32_DEMO function from rnsit_fft module.
+    Thread-safe: per-axis analyses may run concurrently in a thread pool.
     
     Args:
         Data: Raw acceleration data
@@ -166,10 +176,10 @@ def compute_fft(raw_data: List[float], sample_rate: float) -> Tuple[np.ndarray,
     Returns:
         Tuple of (frequencies, amplitudes)
     """
-    if not raw_data or len(raw_data) < 2:
+    if raw_data is None or len(raw_data) < 2:
         raise ValueError("Insufficient data for FFT computation")
     
-    data = np.array(raw_data)
+    data = np.asarray(raw_data, dtype=np.float64)
     n = len(data)
     
     # Apply Hanning window to reduce spectral leakage
@@ -177,7 +187,7 @@ def compute_fft(raw_data: List[float], sample_rate: float) -> Tuple[np.ndarray,
     windowed_data = data * window
     
     # Compute FFT
-    fft_result = np.fft.rfft(windowed_data)
+    fft_result = scipy.fft.rfft(windowed_data, workers=rnsit_fft._FFT_WORKERS)
     
     # Calculate frequency bins
     freqs = np.fft.rfftfreq(n, d=1.0/sample_rate)
@@ -235,6 +245,14 @@ def find_peak_in_band(freqs: np.ndarray, amplitudes: np.ndarray,
     }
 
 
+def _harmonic_arrays(harmonics: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build parallel (harmonic index, amplitude, significance) arrays from harmonic dicts."""
+    harm_idx = np.array([h['harmonic'] for h in harmonics], dtype=np.int64)
+    harm_amps = np.array([h['amplitude'] for h in harmonics], dtype=np.float64)
+    harm_significant = np.array([h.get('isSignificant', False) for h in harmonics], dtype=bool)
+    return harm_idx, harm_amps, harm_significant
+
+
 def detect_harmonics(freqs: np.ndarray, amplitudes: np.ndarray, 
                      running_freq: float, num_harmonics: int = 10,
                      tolerance: float = 0.05, 
@@ -381,16 +399,18 @@ def diagnose_bearing_fault(harmonics: List[Dict],
         'Normal': 0
     }
     
+    harm_idx, harm_amps, harm_significant = _harmonic_arrays(harmonics)
+    
     # Count significant harmonics
-    significant_harmonics = [h for h in harmonics if h.get('isSignificant', False)]
-    harmonic_count = len(significant_harmonics)
+    harmonic_count = int(harm_significant.sum())
     
     # Get 1× and 2× amplitudes
-    amp_1x = next((h['amplitude'] for h in harmonics if h['harmonic'] == 1), 0)
-    amp_2x = next((h['amplitude'] for h in harmonics if h['harmonic'] == 2), 0)
+    amp_1x = float(harm_amps[0]) if len(harm_idx) and harm_idx[0] == 1 else 0
+    amp_2x_matches = harm_amps[harm_idx == 2]
+    amp_2x = float(amp_2x_matches[0]) if len(amp_2x_matches) else 0
     
     # Check for higher harmonics (3× and above)
-    higher_harmonics = [h for h in significant_harmonics if h['harmonic'] >= 3]
+    higher_harmonic_count = int((harm_significant & (harm_idx >= 3)).sum())
     
     # Fault detection logic
     
@@ -418,7 +438,7 @@ def diagnose_bearing_fault(harmonics: List[Dict],
         fault_scores['Mechanical Looseness'] += 3
         evidence.append(f'Multiple harmonics detected ({harmonic_count}×)')
     
-    if len(higher_harmonics) >= 3:
+    if higher_harmonic_count >= 3:
         fault_scores['Mechanical Looseness'] += 2
         evidence.append('Significant higher harmonic content (3× and above)')
     
@@ -475,7 +495,7 @@ def diagnose_bearing_fault(harmonics: List[Dict],
     }
 
 
-def perform_complete_analysis(raw_data: List[float], 
+def perform_complete_analysis(raw_data: Union[List[float], np.ndarray], 
                               sample_rate: float,
                               rpm: float,
                               axis: str = 'V',
@@ -484,7 +504,8 @@ def perform_complete_analysis(raw_data: List[float],
                               calibration_value: float = 1.0,
                               floor_noise_threshold: Optional[float] = None,
                               floor_noise_attenuation: Optional[float] = None,
-                              fmax: Optional[float] = None) -> Dict[str, Any]:
+                              fmax: Optional[float] = None,
+                              include_timeseries: bool = True) -> Dict[str, Any]:
     """
     Perform complete FFT analysis on vibration data using proper signal processing.
     
@@ -507,6 +528,8 @@ def perform_complete_analysis(raw_data: List[float],
         floor_noise_threshold: Threshold percentage for noise attenuation (optional)
         floor_noise_attenuation: Factor to divide noise by (optional)
         fmax: Maximum frequency for FFT output (optional, defaults to sample_rate/4)
+        include_timeseries: Compute the velocity timeseries for the result (default True);
+            skipping it saves a full-length integrate + filter pass
         
     Returns:
         Complete analysis results with FFT spectrum, peaks, harmonics, and diagnosis
@@ -517,7 +540,7 @@ def perform_complete_analysis(raw_data: List[float],
     if rpm is None or rpm <= 0:
         raise ValueError("Valid RPM is required for analysis")
     
-    if not raw_data or len(raw_data) < 100:
+    if raw_data is None or len(raw_data) < 100:
         raise ValueError("Insufficient vibration data for analysis")
     
     if sample_rate <= 0:
@@ -541,17 +564,15 @@ def perform_complete_analysis(raw_data: List[float],
         fmax=fmax,
         floorNoiseThresholdPercentage=floor_noise_threshold,
         floorNoiseAttenuationFactor=floor_noise_attenuation,
-        calibrationValue=calibration_value
+        calibrationValue=calibration_value,
+        includeTimeseries=include_timeseries
     )
     
-    # Extract FFT data from velocity conversion result
-    fft_data = velocity_result.get('FFT', [])
+    # Use the ndarray spectrum directly rather than unpacking the 'FFT' pair list
+    freqs = velocity_result.get('_freqs_arr')
+    amplitudes = velocity_result.get('_amps_arr')
     
-    # Convert to numpy arrays for analysis
-    if fft_data:
-        freqs = np.array([point[0] for point in fft_data])
-        amplitudes = np.array([point[1] for point in fft_data])
-    else:
+    if freqs is None or len(freqs) == 0:
         # Fallback to legacy compute_fft if velocity conversion fails
         freqs, amplitudes = compute_fft(raw_data, sample_rate)
     
@@ -583,11 +604,13 @@ def perform_complete_analysis(raw_data: List[float],
     # Calculate overall velocity RMS from relevant frequency range
     low_cutoff = 10.0  # Hz
     high_cutoff = min(1000.0, freqs[-1] if len(freqs) > 0 else 1000.0)  # Hz
-    freq_mask = (freqs >= low_cutoff) & (freqs <= high_cutoff)
-    relevant_amps = amplitudes[freq_mask] if np.any(freq_mask) else amplitudes
+    # freqs is monotonic, so the band is a contiguous slice
+    lo = np.searchsorted(freqs, low_cutoff)
+    hi = np.searchsorted(freqs, high_cutoff, side='right')
+    relevant_amps = amplitudes[lo:hi] if hi > lo else amplitudes
     
     # Calculate RMS of all amplitudes in the relevant frequency range
-    velocity_rms_overall = float(np.sqrt(np.sum(relevant_amps ** 2))) if len(relevant_amps) > 0 else 0
+    velocity_rms_overall = float(np.linalg.norm(relevant_amps)) if len(relevant_amps) > 0 else 0
     
     # Also keep the 1× peak amplitude for reference
     velocity_rms_1x = peak_1x['amplitude'] if peak_1x else 0
@@ -611,7 +634,7 @@ def perform_complete_analysis(raw_data: List[float],
         'timeseries': velocity_result.get('Timeseries', [])[:1000],  # Limit timeseries for frontend
         'peakAt1x': peak_1x,
         'harmonics': harmonics,
-        'harmonicCount': len([h for h in harmonics if h.get('isSignificant', False)]),
+        'harmonicCount': diagnosis['harmonicCount'],
         'fixedFrequencyPeaks': fixed_freq_peaks,
         'severity': severity,
         'diagnosis': diagnosis,
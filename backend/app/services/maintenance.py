@@ -1,9 +1,64 @@
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import List, Tuple
 import logging
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 from app.database import get_database
 
 logger = logging.getLogger(__name__)
 
+_MONTHS = {
+    "Jan": "01", "Feb": "02", "Mar": "03", "Apr": "04", "May": "05", "Jun": "06",
+    "Jul": "07", "Aug": "08", "Sep": "09", "Oct": "10", "Nov": "11", "Dec": "12",
+}
+
+
+def _parse_rfc822_date(value: str) -> str:
+    """
+    Return 'YYYY-MM-DD' for an RFC 822 timestamp like "Wed, 24 Dec 2025 05:48:22 GMT".
+    Slices the tokens directly; falls back to parsedate_to_datetime for anything unusual.
+    """
+    try:
+        parts = value.split()
+        year, month, day = parts[3], _MONTHS[parts[2]], parts[1]
+        if len(year) == 4 and year.isdigit() and day.isdigit() and len(day) <= 2:
+            return f"{year}-{month}-{day.zfill(2)}"
+    except (KeyError, IndexError):
+        pass
+    return parsedate_to_datetime(value).strftime("%Y-%m-%d")
+
+
+# Number of date fixes sent per bulk_write round-trip
+_BULK_BATCH_SIZE = 500
+
+# Documents fetched per cursor round-trip while scanning for missing dates
+_CURSOR_BATCH_SIZE = 2000
+
+
+def _is_unauthorized(e: Exception) -> bool:
+    """Check for MongoDB 'Unauthorized' (code 13), either direct or inside a bulk write."""
+    if isinstance(e, BulkWriteError):
+        return any(err.get('code') == 13 for err in e.details.get('writeErrors', []))
+    return getattr(e, 'code', None) == 13
+
+
+async def _flush_date_updates(machines_collection, ops: List[UpdateOne]) -> Tuple[int, bool]:
+    """
+    Send pending date fixes in one unordered bulk write.
+    Returns (number of documents updated, whether the database rejected writes as unauthorized).
+    """
+    try:
+        result = await machines_collection.bulk_write(ops, ordered=False)
+        return result.modified_count, False
+    except Exception as e:
+        updated = e.details.get('nModified', 0) if isinstance(e, BulkWriteError) else 0
+        if _is_unauthorized(e):
+            logger.warning("⚠️ Unauthorized to update machine data. Database is likely read-only.")
+            return updated, True
+        logger.debug(f"Failed to bulk update dates for {len(ops)} machines: {e}")
+        return updated, False
+
 async def fix_missing_dates():
     """
     Scans the machines collection for documents missing the 'date' field.
@@ -27,8 +82,12 @@ async def fix_missing_dates():
 
         logger.info(f"🔧 Found {count} machines with missing 'date' field. Starting fix...")
         
-        cursor = machines_collection.find(query)
-        fixed_count = 0
+        # Read phase: drain the cursor (only _id and dataUpdatedTime are needed)
+        # in large batches before writing anything
+        cursor = machines_collection.find(
+            query, projection={"_id": 1, "dataUpdatedTime": 1}
+        ).batch_size(_CURSOR_BATCH_SIZE)
+        date_fixes = []
         
         async for machine in cursor:
             data_time = machine.get("dataUpdatedTime")
@@ -44,28 +103,26 @@ async def fix_missing_dates():
                 if len(data_time) >= 10 and data_time[0:4].isdigit() and data_time[4] == '-':
                     parsed_date = data_time[:10]
                 else:
-                    # Method 2: Try parsing standard formats
-                    from email.utils import parsedate_to_datetime
-                    dt_obj = parsedate_to_datetime(data_time)
-                    parsed_date = dt_obj.strftime("%Y-%m-%d")
+                    # Method 2: Try parsing RFC 822 format
+                    parsed_date = _parse_rfc822_date(data_time)
 
                 if parsed_date:
-                    try:
-                        await machines_collection.update_one(
-                            {"_id": machine["_id"]},
-                            {"$set": {"date": parsed_date}}
-                        )
-                        fixed_count += 1
-                    except Exception as e:
-                        # Check for unauthorized error
-                        if hasattr(e, 'code') and e.code == 13:
-                             logger.warning("⚠️ Unauthorized to update machine data. Database is likely read-only.")
-                             break
-                        logger.debug(f"Failed to update date for machine {machine.get('_id')}: {e}")
-                        continue
+                    date_fixes.append((machine["_id"], parsed_date))
             except Exception as e:
                 logger.debug(f"Failed to parse date for machine {machine.get('_id')}: {e}")
                 continue
+
+        # Write phase: apply the fixes in bulk batches
+        fixed_count = 0
+        for start in range(0, len(date_fixes), _BULK_BATCH_SIZE):
+            ops = [
+                UpdateOne({"_id": machine_id}, {"$set": {"date": parsed_date}})
+                for machine_id, parsed_date in date_fixes[start:start + _BULK_BATCH_SIZE]
+            ]
+            updated, read_only = await _flush_date_updates(machines_collection, ops)
+            fixed_count += updated
+            if read_only:
+                break
                 
         if fixed_count > 0:
             logger.info(f"✅ Fixed 'date' field for {fixed_count} machines.")
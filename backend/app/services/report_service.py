@@ -6,10 +6,22 @@ Uses the FFT analysis functions from fft_analysis.py for signal processing.
 """
 
 import io
+import os
+import tempfile
+import asyncio
+import bisect
+import functools
+import inspect
 import logging
-from typing import Dict, List, Optional, Any
+import math
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Any, BinaryIO
 from datetime import datetime
 import httpx
+import orjson
 
 # PDF generation
 from reportlab.lib import colors
@@ -22,11 +34,13 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 # Chart generation
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 
 # Import FFT analysis functions
 try:
+    from app.services.rnsit_fft import set_fft_workers
     from app.services.fft_analysis import (
         velocity_convert,
         perform_complete_analysis,
@@ -36,6 +50,7 @@ try:
         ZONE_COLORS
     )
 except ImportError:
+    from services.rnsit_fft import set_fft_workers
     from services.fft_analysis import (
         velocity_convert,
         perform_complete_analysis,
@@ -50,6 +65,66 @@ DATA_URL = "https://srcapiv2.aams.io/AAMS/AI/Data"
 BEARING_URL = "https://srcapiv2.aams.io/AAMS/AI/BearingLocation"
 HEADERS = {'Content-Type': 'application/json'}
 
+# Max concurrent external API fetches per report
+_FETCH_CONCURRENCY = 16
+
+# PDFs are built in memory up to this size, then spill to a temp file
+_PDF_SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Connection pool for the client shared by all fetches of one report
+_REPORT_CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# 30s for the (large) responses, but give up quickly on unreachable hosts
+_REPORT_CLIENT_TIMEOUT = httpx.Timeout(read=30.0, connect=3.0, write=5.0, pool=3.0)
+
+# After this many axis fetches in a row fail to reach the external API
+# (connection errors, timeouts) it is treated as down and the rest of the
+# report's fetches are skipped
+_MAX_CONSECUTIVE_FETCH_FAILURES = 6
+
+# External API responses are reused for this long (seconds), e.g. between a
+# report preview and the PDF download that follows it
+_FETCH_CACHE_TTL = 60
+# Each raw-data entry holds a full parsed waveform, so keep only about one
+# large machine's worth of axes
+_RAW_DATA_CACHE_MAXSIZE = 64
+_BEARINGS_CACHE_MAXSIZE = 256
+
+# ------------------- Process Pool for FFT Analysis -------------------
+_fft_pool = None
+
+def get_fft_pool() -> ProcessPoolExecutor:
+    """Get or create the process pool that runs FFT analysis off the event loop"""
+    global _fft_pool
+    if _fft_pool is None:
+        # Workers start lazily from the threaded server process, so don't fork it
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        _fft_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context(start_method),
+            # One worker per core already, so each worker's FFTs run single-threaded
+            initializer=set_fft_workers,
+            initargs=(1,)
+        )
+    return _fft_pool
+
+def discard_fft_pool(pool: ProcessPoolExecutor):
+    """Drop a broken FFT pool so the next get_fft_pool() call starts a fresh one"""
+    global _fft_pool
+    if _fft_pool is pool:
+        _fft_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+# ------------------- Thread Pool for Chart Rendering -------------------
+_chart_pool = None
+
+def get_chart_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool that renders FFT charts concurrently"""
+    global _chart_pool
+    if _chart_pool is None:
+        _chart_pool = ThreadPoolExecutor(max_workers=4)
+    return _chart_pool
+
 
 # ==========================================
 # SEVERITY COLORS FOR PDF
@@ -62,41 +137,133 @@ SEVERITY_PDF_COLORS = {
 }
 
 
+_STATUS_TO_SEVERITY = {
+    'normal': 'A',
+    'satisfactory': 'B',
+    'alert': 'C',
+    'unacceptable': 'D',
+    'unsatisfactory': 'D',
+}
+
+# Severity zones ranked from best to worst
+_ZONE_RANK = {'A': 0, 'B': 1, 'C': 2, 'D': 3}
+
+# Velocity thresholds (mm/s) and the colors for the bands between them
+_VEL_THRESHOLDS = [2.8, 4.5, 7.1]
+_VEL_COLORS = [
+    colors.HexColor('#10b981'),  # Green
+    colors.HexColor('#f59e0b'),  # Yellow
+    colors.HexColor('#fb923c'),  # Orange
+    colors.HexColor('#ef4444'),  # Red
+]
+
+
 def get_status_severity(status: str) -> str:
     """Map status name to severity zone."""
-    s = (status or '').lower()
-    if s == 'normal':
-        return 'A'
-    if s == 'satisfactory':
-        return 'B'
-    if s == 'alert':
-        return 'C'
-    if s in ['unacceptable', 'unsatisfactory']:
-        return 'D'
-    return 'A'
+    return _STATUS_TO_SEVERITY.get((status or '').lower(), 'A')
 
 
 def get_velocity_color(vel: float) -> colors.Color:
-    """Get color based on velocity value."""
-    if vel > 7.1:
-        return colors.HexColor('#ef4444')  # Red
-    if vel > 4.5:
-        return colors.HexColor('#fb923c')  # Orange
-    if vel > 2.8:
-        return colors.HexColor('#f59e0b')  # Yellow
-    return colors.HexColor('#10b981')  # Green
+    """Get color based on velocity value (a value on a threshold takes the lower band)."""
+    return _VEL_COLORS[bisect.bisect_left(_VEL_THRESHOLDS, vel)]
+
 
+def _async_ttl_cache(ttl: float, maxsize: int):
+    """
+    Cache an async fetch function's result per argument set for `ttl` seconds.
+    
+    The `client` argument is not part of the key, so finished results are
+    shared across clients. An in-flight request runs on its first caller's
+    client, which that caller may close, so it is only shared with callers
+    passing the same client (or none, when it opens its own). It is cancelled
+    once every caller waiting on it has been cancelled. Failed or empty
+    results are dropped so the next call retries. Expired entries are swept
+    on every insert so stale results don't stay in memory.
+    """
+    def decorator(func):
+        sig = inspect.signature(func)
+        cache: Dict[tuple, list] = {}  # key -> [expiry, task, client, waiters]
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(v for k, v in bound.arguments.items() if k != 'client')
+            client = bound.arguments.get('client')
+            
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            entry = cache.get(key)
+            if (entry is None or entry[0] <= now or entry[1].get_loop() is not loop
+                    or not (entry[1].done() or entry[2] is None or entry[2] is client)):
+                task = loop.create_task(func(*args, **kwargs))
+                cache.pop(key, None)
+                # Entries are kept in insertion order with one ttl, so the
+                # expired ones are all at the front
+                while cache and next(iter(cache.values()))[0] <= now:
+                    cache.pop(next(iter(cache)))
+                cache[key] = entry = [now + ttl, task, client, 0]
+                while len(cache) > maxsize:
+                    cache.pop(next(iter(cache)))
+                
+                def on_done(t: asyncio.Task, key=key, entry=entry):
+                    entry[2] = None  # the result no longer depends on the client
+                    if t.cancelled() or t.exception() is not None or not t.result():
+                        if cache.get(key) is entry:
+                            del cache[key]
+                
+                task.add_done_callback(on_done)
+            
+            # Shield so one cancelled caller does not cancel the shared request
+            task = entry[1]
+            entry[3] += 1
+            try:
+                return await asyncio.shield(task)
+            finally:
+                entry[3] -= 1
+                if entry[3] == 0 and not task.done():
+                    # Every caller was cancelled; don't leave the request
+                    # running on a client its owner is about to close
+                    if cache.get(key) is entry:
+                        del cache[key]
+                    task.cancel()
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
 
+
+def _create_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """Create an HTTP/2 client for the external API that retries a failed connect once."""
+    transport = httpx.AsyncHTTPTransport(
+        http2=True, retries=1, limits=limits or httpx.Limits()
+    )
+    return httpx.AsyncClient(timeout=_REPORT_CLIENT_TIMEOUT, transport=transport)
+
+
+async def _post(client: Optional[httpx.AsyncClient], url: str, payload: Dict) -> httpx.Response:
+    """POST JSON with the shared client if given, else with a one-off client."""
+    if client is not None:
+        return await client.post(url, headers=HEADERS, json=payload)
+    async with _create_client() as own_client:
+        return await own_client.post(url, headers=HEADERS, json=payload)
+
+
+@_async_ttl_cache(ttl=_FETCH_CACHE_TTL, maxsize=_RAW_DATA_CACHE_MAXSIZE)
 async def fetch_bearing_data_for_report(
     machine_id: str,
     bearing_id: str,
     axis: str,
-    data_type: str = "OFFLINE"
+    data_type: str = "OFFLINE",
+    client: Optional[httpx.AsyncClient] = None
 ) -> Optional[Dict]:
     """
     Fetch raw vibration data for a bearing axis from external API.
     
-    Returns dict with rawData, rpm, SR or None if fetch fails.
+    Pass a shared client to reuse its connections; otherwise a one-off client is used.
+    Successful responses are cached for _FETCH_CACHE_TTL seconds.
+    Returns dict with rawData, rpm, SR or None if the API answers with an error.
+    Raises httpx.TransportError (connection errors, timeouts) if the API can't be reached.
     """
     payload = {
         "machineId": machine_id,
@@ -107,84 +274,321 @@ async def fetch_bearing_data_for_report(
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(DATA_URL, headers=HEADERS, json=payload)
-            if response.status_code == 200:
-                return response.json()
+        response = await _post(client, DATA_URL, payload)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+    except httpx.TransportError:
+        raise
     except Exception as e:
         logging.warning(f"Failed to fetch data for {bearing_id} {axis}: {e}")
     
     return None
 
 
-async def fetch_bearings_for_machine(machine_id: str) -> List[Dict]:
-    """Fetch bearings list for a machine from external API."""
+@_async_ttl_cache(ttl=_FETCH_CACHE_TTL, maxsize=_BEARINGS_CACHE_MAXSIZE)
+async def fetch_bearings_for_machine(
+    machine_id: str,
+    client: Optional[httpx.AsyncClient] = None
+) -> List[Dict]:
+    """Fetch bearings list for a machine from external API (cached for _FETCH_CACHE_TTL seconds)."""
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                BEARING_URL, 
-                headers=HEADERS, 
-                json={"machineId": machine_id}
-            )
-            if response.status_code == 200:
-                return response.json()
+        response = await _post(client, BEARING_URL, {"machineId": machine_id})
+        if response.status_code == 200:
+            return orjson.loads(response.content)
     except Exception as e:
         logging.warning(f"Failed to fetch bearings for {machine_id}: {e}")
     
     return []
 
 
-def create_fft_chart(fft_data: List[Dict], title: str, color: str = '#3b82f6') -> io.BytesIO:
+# ------------------- Reusable FFT Chart Figure -------------------
+# Building a figure and running tight_layout dominates chart time, so one
+# pre-laid-out figure is kept per rendering thread and only its data/title
+# change per chart. Per-thread figures let the chart pool render in parallel.
+_chart_local = threading.local()
+
+# Max points plotted per chart (about 2x the 600px chart width)
+_CHART_MAX_POINTS = 1200
+
+def _get_chart():
+    """Get or create this thread's (figure, axes, line, fill, no-data text) chart artists"""
+    chart = getattr(_chart_local, 'chart', None)
+    if chart is None:
+        fig = Figure(figsize=(6, 2.5), dpi=100)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        line, = ax.plot([], [], linewidth=0.8)
+        no_data_text = ax.text(0.5, 0.5, 'No data available', ha='center', va='center',
+                               fontsize=10, color='gray', transform=ax.transAxes, visible=False)
+        ax.set_xlabel('Frequency (Hz)', fontsize=8)
+        ax.set_ylabel('Velocity (mm/s)', fontsize=8)
+        ax.set_title('FFT Spectrum', fontsize=9, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='both', labelsize=7)
+        fig.tight_layout()
+        chart = _chart_local.chart = [fig, ax, line, None, no_data_text]
+    return chart
+
+
+def create_fft_chart(
+    fft_data: List[Dict],
+    title: str,
+    color: str = '#3b82f6',
+    format: str = 'jpeg',
+    dpi: int = 72
+) -> io.BytesIO:
     """
-    Create an FFT spectrum chart as PNG image.
+    Create an FFT spectrum chart image.
     
     Args:
         fft_data: List of {frequency, amplitude} dicts
         title: Chart title
         color: Line color hex
+        format: Image format ('jpeg' or 'png')
+        dpi: Output resolution
         
     Returns:
-        BytesIO buffer containing PNG image
+        BytesIO buffer containing the image
     """
-    fig, ax = plt.subplots(figsize=(6, 2.5), dpi=100)
+    chart = _get_chart()
+    fig, ax, line, fill, no_data_text = chart
+    
+    # Drop the previous chart's fill
+    if fill is not None:
+        fill.remove()
+        chart[3] = None
     
     if fft_data and len(fft_data) > 0:
-        frequencies = [d.get('frequency', 0) for d in fft_data]
-        amplitudes = [d.get('amplitude', 0) for d in fft_data]
+        frequencies = np.array([d.get('frequency', 0) for d in fft_data], dtype=np.float64)
+        amplitudes = np.array([d.get('amplitude', 0) for d in fft_data], dtype=np.float64)
+        
+        # Max-pool down to about the chart's pixel width; neighbouring bins
+        # land on the same pixel anyway and keeping the max preserves peaks
+        stride = max(1, len(amplitudes) // _CHART_MAX_POINTS)
+        if stride > 1:
+            starts = np.arange(0, len(amplitudes), stride)
+            frequencies = frequencies[starts]
+            amplitudes = np.maximum.reduceat(amplitudes, starts)
         
-        ax.plot(frequencies, amplitudes, color=color, linewidth=0.8)
-        ax.fill_between(frequencies, amplitudes, alpha=0.2, color=color)
+        line.set_data(frequencies, amplitudes)
+        line.set_color(color)
+        chart[3] = ax.fill_between(frequencies, amplitudes, alpha=0.2, color=color)
         
         ax.set_xlabel('Frequency (Hz)', fontsize=8)
         ax.set_ylabel('Velocity (mm/s)', fontsize=8)
+        no_data_text.set_visible(False)
     else:
-        ax.text(0.5, 0.5, 'No data available', ha='center', va='center', 
-                fontsize=10, color='gray', transform=ax.transAxes)
+        line.set_data([], [])
+        ax.set_xlabel('')
+        ax.set_ylabel('')
+        no_data_text.set_visible(True)
     
     ax.set_title(title, fontsize=9, fontweight='bold')
-    ax.grid(True, alpha=0.3)
-    ax.tick_params(axis='both', labelsize=7)
     
-    # Set y-axis to start at 0
+    # Rescale to the new data (an empty chart gets the default unit
+    # limits back), then set y-axis to start at 0
+    if fft_data and len(fft_data) > 0:
+        ax.relim()
+        ax.autoscale(True)
+        ax.autoscale_view()
+    else:
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
     ax.set_ylim(bottom=0)
     
-    plt.tight_layout()
-    
+    # The figure is laid out once up front, so no bbox_inches='tight' re-render
     buf = io.BytesIO()
-    plt.savefig(buf, format='png', bbox_inches='tight', dpi=100)
-    plt.close(fig)
+    if format == 'jpeg':
+        fig.savefig(buf, format='jpeg', dpi=dpi, pil_kwargs={'quality': 80, 'optimize': False})
+    else:
+        fig.savefig(buf, format=format, dpi=dpi)
     buf.seek(0)
     
     return buf
 
 
+def parse_raw_data(raw_data: Any) -> np.ndarray:
+    """
+    Parse API rawData (comma-separated string or list) into a float64 array.
+    
+    Uses NumPy's C parsers; falls back to element-wise parsing only for
+    malformed input, keeping the original leniency rules.
+    """
+    if isinstance(raw_data, str):
+        # fromstring stops at the first malformed field, so a short result means
+        # the input needs the lenient path (which also skips empty fields)
+        try:
+            parsed = np.fromstring(raw_data, sep=',', dtype=np.float64)
+            if len(parsed) == raw_data.count(',') + 1:
+                return parsed
+        except ValueError:
+            pass
+        return np.array([float(x.strip()) for x in raw_data.split(',') if x.strip()], dtype=np.float64)
+    
+    if isinstance(raw_data, list):
+        try:
+            parsed = np.asarray(raw_data, dtype=np.float64)
+            # None entries become NaN here; let the slow path map them to 0
+            if parsed.ndim == 1 and not np.isnan(parsed).any():
+                return parsed
+        except (ValueError, TypeError):
+            pass
+        
+        parsed = []
+        for x in raw_data:
+            try:
+                parsed.append(float(x) if isinstance(x, (int, float, str)) else 0)
+            except:
+                pass
+        return np.array(parsed, dtype=np.float64)
+    
+    return np.empty(0, dtype=np.float64)
+
+
+def velocity_rms_upper_bound(raw_data: np.ndarray, cutoff: float = 4.0) -> float:
+    """
+    Cheap upper bound (mm/s) on the velocity RMS perform_complete_analysis reports.
+    
+    Integration divides each component by 2*pi*f and the highpass removes
+    everything well below `cutoff`, so the velocity is at most
+    accel_rms / (2*pi*cutoff). The sqrt(3) covers the spectrum-norm RMS
+    (Hann x2 scaling) used by the analysis.
+    """
+    accel_rms = float(np.std(raw_data)) * 9807  # g -> mm/s^2
+    return math.sqrt(3) * accel_rms / (2 * math.pi * cutoff)
+
+
+async def analyze_axis_response(
+    raw_response: Optional[Dict],
+    b_id: str,
+    axis: str,
+    machine_class: str = 'II',
+    skip_healthy_fft: bool = False
+) -> Dict[str, Any]:
+    """
+    Parse one axis API response and run FFT analysis on it in the process pool.
+    
+    Args:
+        raw_response: Response from fetch_bearing_data_for_report (None if fetch failed)
+        b_id: Bearing ID (for logging)
+        axis: Axis name (H-Axis, V-Axis, A-Axis)
+        machine_class: ISO machine class (I, II, III, IV)
+        skip_healthy_fft: Skip the FFT when the signal is provably deep in Zone A
+            (the entry then has no spectrum and only a velocityRMSUpperBound)
+        
+    Returns:
+        axisData entry for the report
+    """
+    if not raw_response:
+        return {
+            'available': False,
+            'error': 'Failed to fetch data from API'
+        }
+    
+    axis_short = axis.replace('-Axis', '')
+    raw_data = raw_response.get('rawData', [])
+    rpm = raw_response.get('rpm')
+    sample_rate = raw_response.get('SR', 10000)
+    
+    # Parse values
+    try:
+        sample_rate = float(sample_rate)
+    except:
+        sample_rate = 10000.0
+    
+    try:
+        rpm = float(rpm) if rpm else None
+    except:
+        rpm = None
+    
+    # Parse raw data
+    raw_data = parse_raw_data(raw_data)
+    
+    if len(raw_data) < 100:
+        # API returned 200 but no data available for this axis
+        logging.info(f"[ReportService] {b_id} {axis}: No data available (rawData len={len(raw_data)})")
+        return {
+            'available': False,
+            'error': 'No data available for this axis'
+        }
+    
+    if not rpm or rpm <= 0:
+        return {
+            'available': False,
+            'error': 'Missing RPM value'
+        }
+    
+    if skip_healthy_fft:
+        velocity_bound = velocity_rms_upper_bound(raw_data)
+        thresholds = ISO_THRESHOLDS.get(machine_class, ISO_THRESHOLDS['II'])
+        if velocity_bound < thresholds['A'] * 0.5:
+            logging.info(f"[ReportService] {b_id} {axis}: Skipping FFT, vRMS <= {velocity_bound:.2f}")
+            # Only the zone is known; the bound is not a measured velocity RMS,
+            # so it is kept out of 'velocityRMS'
+            severity = get_iso_severity_zone(velocity_bound, machine_class)
+            return {
+                'available': True,
+                'rpm': rpm,
+                'sampleRate': sample_rate,
+                'fftSpectrum': [],
+                'velocityRMSUpperBound': severity.pop('velocityRMS'),
+                'severity': severity,
+                'diagnosis': {},
+                'harmonics': [],
+                'peakAt1x': {}
+            }
+    
+    # Perform FFT analysis in a worker process so the event loop stays free
+    analysis_job = functools.partial(
+        perform_complete_analysis,
+        raw_data=raw_data,
+        sample_rate=sample_rate,
+        rpm=rpm,
+        axis=axis_short,
+        machine_class=machine_class,
+        include_timeseries=False  # the report never shows the TWF
+    )
+    try:
+        loop = asyncio.get_running_loop()
+        pool = get_fft_pool()
+        try:
+            analysis = await loop.run_in_executor(pool, analysis_job)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM kill); replace the pool and retry once
+            logging.warning(f"[ReportService] FFT process pool broke during {b_id} {axis}; restarting it")
+            discard_fft_pool(pool)
+            analysis = await loop.run_in_executor(get_fft_pool(), analysis_job)
+    except Exception as e:
+        logging.warning(f"FFT analysis failed for {b_id} {axis}: {e}")
+        return {
+            'available': False,
+            'error': str(e)
+        }
+    
+    logging.info(f"[ReportService] {b_id} {axis}: Analysis complete, vRMS={analysis.get('severity', {}).get('velocityRMS', 0):.2f}")
+    
+    return {
+        'available': True,
+        'rpm': rpm,
+        'sampleRate': sample_rate,
+        'fftSpectrum': analysis.get('fftSpectrum', []),
+        'velocityRMS': analysis.get('severity', {}).get('velocityRMS', 0),
+        'severity': analysis.get('severity', {}),
+        'diagnosis': analysis.get('diagnosis', {}),
+        'harmonics': analysis.get('harmonics', []),
+        'peakAt1x': analysis.get('peakAt1x', {})
+    }
+
+
 async def prepare_report_data(
     machine_id: str,
     machine_data: Optional[Dict] = None,
     bearings: Optional[List[Dict]] = None,
     bearing_id: Optional[str] = None,
     machine_class: str = 'II',
-    data_type: str = 'OFFLINE'
+    data_type: str = 'OFFLINE',
+    now: Optional[datetime] = None,
+    skip_healthy_fft: bool = False
 ) -> Dict[str, Any]:
     """
     Prepare all data needed for report generation using new FFT logic.
@@ -196,180 +600,146 @@ async def prepare_report_data(
         bearing_id: Optional specific bearing ID (for single bearing report)
         machine_class: ISO machine class (I, II, III, IV)
         data_type: ONLINE or OFFLINE
+        now: Optional report timestamp (defaults to the current time)
+        skip_healthy_fft: Skip the FFT for axes provably deep in Zone A (no spectrum needed)
         
     Returns:
         Dict containing all report data including FFT analysis results
     """
     logging.info(f"[ReportService] Preparing report data for machine {machine_id}")
+    report_date = (now or datetime.now()).isoformat()
     
-    # Fetch bearings if not provided
-    if bearings is None:
-        bearings = await fetch_bearings_for_machine(machine_id)
-    
-    # Filter to specific bearing if requested
-    if bearing_id:
-        bearings = [b for b in bearings if b.get('_id') == bearing_id or b.get('bearingLocationId') == bearing_id]
-    
-    if not bearings:
-        logging.warning(f"No bearings found for machine {machine_id}")
-        return {
-            'machine': machine_data or {'machineId': machine_id},
-            'bearings': [],
-            'reportDate': datetime.now().isoformat(),
-            'error': 'No bearings found'
-        }
-    
-    # Process each bearing with FFT analysis
-    bearings_data = []
-    axes = ['H-Axis', 'V-Axis', 'A-Axis']
-    
-    for bearing in bearings:
-        b_id = bearing.get('_id') or bearing.get('bearingLocationId')
-        b_name = bearing.get('name') or bearing.get('bearingName') or b_id
-        b_status = bearing.get('statusName') or bearing.get('status') or 'Unknown'
+    # One client for every fetch of this report so connections are reused
+    # HTTP/2 multiplexes the concurrent axis fetches over a single connection
+    async with _create_client(_REPORT_CLIENT_LIMITS) as client:
+        # Fetch bearings if not provided
+        if bearings is None:
+            bearings = await fetch_bearings_for_machine(machine_id, client=client)
         
-        bearing_result = {
-            'bearingId': b_id,
-            'bearingName': b_name,
-            'status': b_status,
-            'severity': get_status_severity(b_status),
-            'axisData': {}
-        }
+        # Filter to specific bearing if requested
+        if bearing_id:
+            bearings = [b for b in bearings if b.get('_id') == bearing_id or b.get('bearingLocationId') == bearing_id]
         
-        # Fetch and analyze data for each axis
-        for axis in axes:
-            axis_short = axis.replace('-Axis', '')
-            
-            # Fetch raw data from API
-            raw_response = await fetch_bearing_data_for_report(
-                machine_id, b_id, axis, data_type
-            )
-            
-            if raw_response:
-                raw_data = raw_response.get('rawData', [])
-                rpm = raw_response.get('rpm')
-                sample_rate = raw_response.get('SR', 10000)
-                
-                # Parse values
-                try:
-                    sample_rate = float(sample_rate)
-                except:
-                    sample_rate = 10000.0
-                
+        if not bearings:
+            logging.warning(f"No bearings found for machine {machine_id}")
+            return {
+                'machine': machine_data or {'machineId': machine_id},
+                'bearings': [],
+                'reportDate': report_date,
+                'error': 'No bearings found'
+            }
+        
+        # Schedule every bearing's fetches up front. Each bearing is analysed as
+        # soon as its own axes arrive while later fetches continue in flight.
+        axes = ['H-Axis', 'V-Axis', 'A-Axis']
+        bearing_ids = [b.get('_id') or b.get('bearingLocationId') for b in bearings]
+        semaphore = asyncio.Semaphore(_FETCH_CONCURRENCY)
+        
+        consecutive_failures = 0
+        
+        async def fetch_limited(b_id: str, axis: str) -> Optional[Dict]:
+            nonlocal consecutive_failures
+            async with semaphore:
+                if consecutive_failures >= _MAX_CONSECUTIVE_FETCH_FAILURES:
+                    return None
                 try:
-                    rpm = float(rpm) if rpm else None
-                except:
-                    rpm = None
-                
-                # Parse raw data
-                if isinstance(raw_data, str):
-                    raw_data = [float(x.strip()) for x in raw_data.split(',') if x.strip()]
-                elif isinstance(raw_data, list):
-                    parsed = []
-                    for x in raw_data:
-                        try:
-                            parsed.append(float(x) if isinstance(x, (int, float, str)) else 0)
-                        except:
-                            pass
-                    raw_data = parsed
-                
-                # Perform FFT analysis if we have valid data
-                if raw_data and len(raw_data) >= 100 and rpm and rpm > 0:
-                    try:
-                        analysis = perform_complete_analysis(
-                            raw_data=raw_data,
-                            sample_rate=sample_rate,
-                            rpm=rpm,
-                            axis=axis_short,
-                            machine_class=machine_class
+                    result = await fetch_bearing_data_for_report(
+                        machine_id, b_id, axis, data_type, client=client
+                    )
+                except httpx.TransportError as e:
+                    # Only an unreachable API counts towards giving up; error
+                    # answers from a healthy API don't
+                    logging.warning(f"Failed to fetch data for {b_id} {axis}: {e!r}")
+                    consecutive_failures += 1
+                    if consecutive_failures == _MAX_CONSECUTIVE_FETCH_FAILURES:
+                        logging.warning(
+                            f"[ReportService] {consecutive_failures} fetches in a row could not reach the API "
+                            f"for machine {machine_id}; skipping the remaining fetches"
                         )
-                        
-                        bearing_result['axisData'][axis_short] = {
-                            'available': True,
-                            'rpm': rpm,
-                            'sampleRate': sample_rate,
-                            'fftSpectrum': analysis.get('fftSpectrum', []),
-                            'velocityRMS': analysis.get('severity', {}).get('velocityRMS', 0),
-                            'severity': analysis.get('severity', {}),
-                            'diagnosis': analysis.get('diagnosis', {}),
-                            'harmonics': analysis.get('harmonics', []),
-                            'peakAt1x': analysis.get('peakAt1x', {})
-                        }
-                        
-                        logging.info(f"[ReportService] {b_id} {axis}: Analysis complete, vRMS={analysis.get('severity', {}).get('velocityRMS', 0):.2f}")
-                        
-                    except Exception as e:
-                        logging.warning(f"FFT analysis failed for {b_id} {axis}: {e}")
-                        bearing_result['axisData'][axis_short] = {
-                            'available': False,
-                            'error': str(e)
-                        }
-                elif not raw_data or len(raw_data) < 100:
-                    # API returned 200 but no data available for this axis
-                    bearing_result['axisData'][axis_short] = {
-                        'available': False,
-                        'error': 'No data available for this axis'
-                    }
-                    logging.info(f"[ReportService] {b_id} {axis}: No data available (rawData len={len(raw_data) if raw_data else 0})")
-                else:
-                    bearing_result['axisData'][axis_short] = {
-                        'available': False,
-                        'error': 'Missing RPM value'
-                    }
-            else:
-                bearing_result['axisData'][axis_short] = {
-                    'available': False,
-                    'error': 'Failed to fetch data from API'
-                }
+                    return None
+            consecutive_failures = 0
+            return result
         
-        # Determine overall bearing severity (worst case across axes)
-        severity_order = ['A', 'B', 'C', 'D']
-        worst_severity = 'A'
+        async def fetch_all_axes(b_id: str) -> List[Any]:
+            return await asyncio.gather(
+                *(fetch_limited(b_id, axis) for axis in axes),
+                return_exceptions=True
+            )
         
-        for axis_short, axis_data in bearing_result['axisData'].items():
-            if axis_data.get('available') and axis_data.get('severity', {}).get('zone'):
-                zone = axis_data['severity']['zone']
-                if severity_order.index(zone) > severity_order.index(worst_severity):
-                    worst_severity = zone
+        fetch_tasks = [asyncio.create_task(fetch_all_axes(b_id)) for b_id in bearing_ids]
         
-        bearing_result['overallSeverity'] = worst_severity
-        bearing_result['overallSeverityLabel'] = ZONE_LABELS.get(worst_severity, 'Unknown')
+        async def process_bearing(i: int, bearing: Dict) -> Dict[str, Any]:
+            b_id = bearing_ids[i]
+            b_name = bearing.get('name') or bearing.get('bearingName') or b_id
+            b_status = bearing.get('statusName') or bearing.get('status') or 'Unknown'
+            
+            bearing_result = {
+                'bearingId': b_id,
+                'bearingName': b_name,
+                'status': b_status,
+                'severity': get_status_severity(b_status),
+                'axisData': {}
+            }
+            
+            # Analyze all axes of this bearing in parallel
+            raw_responses = []
+            for axis, raw_response in zip(axes, await fetch_tasks[i]):
+                if isinstance(raw_response, Exception):
+                    logging.warning(f"Failed to fetch data for {b_id} {axis}: {raw_response}")
+                    raw_response = None
+                raw_responses.append(raw_response)
+            
+            axis_results = await asyncio.gather(*(
+                analyze_axis_response(raw_response, b_id, axis, machine_class, skip_healthy_fft)
+                for axis, raw_response in zip(axes, raw_responses)
+            ))
+            for axis, axis_result in zip(axes, axis_results):
+                bearing_result['axisData'][axis.replace('-Axis', '')] = axis_result
+            
+            # Determine overall bearing severity (worst case across axes)
+            worst_severity = 'A'
+            worst_rank = 0
+            
+            for axis_data in bearing_result['axisData'].values():
+                if axis_data.get('available'):
+                    zone = axis_data.get('severity', {}).get('zone')
+                    rank = _ZONE_RANK.get(zone, 0)
+                    if rank > worst_rank:
+                        worst_rank, worst_severity = rank, zone
+            
+            bearing_result['overallSeverity'] = worst_severity
+            bearing_result['overallSeverityLabel'] = ZONE_LABELS.get(worst_severity, 'Unknown')
+            
+            return bearing_result
         
-        bearings_data.append(bearing_result)
+        # Process every bearing concurrently so analyses of different bearings
+        # share the process pool; gather keeps the bearings in order
+        bearing_tasks = [
+            asyncio.create_task(process_bearing(i, bearing)) for i, bearing in enumerate(bearings)
+        ]
+        try:
+            bearings_data = await asyncio.gather(*bearing_tasks)
+        finally:
+            # Don't leave fetches or analyses running against a closed client
+            for task in fetch_tasks + bearing_tasks:
+                task.cancel()
     
     return {
         'machine': machine_data or {'machineId': machine_id},
         'bearings': bearings_data,
-        'reportDate': datetime.now().isoformat(),
+        'reportDate': report_date,
         'machineClass': machine_class,
         'dataType': data_type
     }
 
 
-async def generate_pdf_report(
-    report_data: Dict[str, Any],
-    include_charts: bool = True
-) -> io.BytesIO:
-    """
-    Generate a PDF report from prepared report data.
-    
-    Args:
-        report_data: Data from prepare_report_data()
-        include_charts: Whether to include FFT charts
-        
-    Returns:
-        BytesIO buffer containing PDF
-    """
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=15*mm,
-        leftMargin=15*mm,
-        topMargin=15*mm,
-        bottomMargin=15*mm
-    )
-    
+# ------------------- Static PDF Content -------------------
+# Styles and the parts of the report that never change are built once and
+# reused; reportlab flowables can be laid out again in later documents.
+
+@functools.lru_cache(maxsize=1)
+def _report_styles():
+    """Get the (title, heading, normal) paragraph styles used by the PDF report"""
     styles = getSampleStyleSheet()
     
     # Custom styles
@@ -396,13 +766,94 @@ async def generate_pdf_report(
         spaceAfter=4
     )
     
+    return title_style, heading_style, normal_style
+
+
+@functools.lru_cache(maxsize=1)
+def _severity_legend_flowables():
+    """Get the ISO 10816-3 severity legend heading and table"""
+    heading_style = _report_styles()[1]
+    
+    severity_legend = [
+        ['Zone', 'Description', 'Threshold'],
+        ['A', 'Normal - Newly commissioned', '< 1.12 mm/s'],
+        ['B', 'Satisfactory - Unrestricted long-term operation', '1.12 - 2.8 mm/s'],
+        ['C', 'Alert - Restricted operation', '2.8 - 7.1 mm/s'],
+        ['D', 'Unacceptable - Immediate action required', '> 7.1 mm/s']
+    ]
+    
+    legend_table = Table(severity_legend, colWidths=[40, 200, 100])
+    legend_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 7),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 1), (0, 1), SEVERITY_PDF_COLORS['A']),
+        ('BACKGROUND', (0, 2), (0, 2), SEVERITY_PDF_COLORS['B']),
+        ('BACKGROUND', (0, 3), (0, 3), SEVERITY_PDF_COLORS['C']),
+        ('BACKGROUND', (0, 4), (0, 4), SEVERITY_PDF_COLORS['D']),
+        ('TEXTCOLOR', (0, 1), (0, -1), colors.white),
+        ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 3),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
+    ]))
+    
+    return (Paragraph("Severity Levels (ISO 10816-3)", heading_style), legend_table)
+
+
+@functools.lru_cache(maxsize=1)
+def _footer_note_paragraph() -> Paragraph:
+    """Get the report footer note"""
+    footer_note = """
+    <para fontSize="7" textColor="#6b7280">
+    Report generated by AAMS Vibration Analysis System. Based on ISO 10816-3:2009/Amd 1:2017 standard.
+    Severity levels are general guidelines and should be interpreted in context of machine-specific conditions.
+    For more information, visit <link href="http://app.aams.io">http://app.aams.io</link>
+    </para>
+    """
+    return Paragraph(footer_note, _report_styles()[2])
+
+
+async def generate_pdf_report(
+    report_data: Dict[str, Any],
+    include_charts: bool = True
+) -> BinaryIO:
+    """
+    Generate a PDF report from prepared report data.
+    
+    Args:
+        report_data: Data from prepare_report_data()
+        include_charts: Whether to include FFT charts
+        
+    Returns:
+        Binary file buffer containing PDF (spooled to disk past _PDF_SPOOL_MAX_SIZE);
+        the caller should close it when done
+    """
+    buffer = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX_SIZE)
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=15*mm,
+        leftMargin=15*mm,
+        topMargin=15*mm,
+        bottomMargin=15*mm
+    )
+    
+    title_style, heading_style, normal_style = _report_styles()
+    
     elements = []
     
     # ==================== HEADER ====================
     machine = report_data.get('machine', {})
     machine_name = machine.get('name') or machine.get('machineName') or machine.get('machineId', 'Unknown')
     machine_id = machine.get('machineId') or machine.get('_id', 'N/A')
-    report_date = datetime.now().strftime('%Y-%m-%d %H:%M')
+    report_timestamp = report_data.get('reportDate')
+    report_date = (
+        datetime.fromisoformat(report_timestamp) if report_timestamp else datetime.now()
+    ).strftime('%Y-%m-%d %H:%M')
     
     elements.append(Paragraph("VIBRATION ANALYSIS REPORT", title_style))
     elements.append(Spacer(1, 5*mm))
@@ -433,35 +884,7 @@ async def generate_pdf_report(
     elements.append(Spacer(1, 8*mm))
     
     # ==================== ISO SEVERITY LEGEND ====================
-    elements.append(Paragraph("Severity Levels (ISO 10816-3)", heading_style))
-    
-    severity_legend = [
-        ['Zone', 'Description', 'Threshold'],
-        ['A', 'Normal - Newly commissioned', '< 1.12 mm/s'],
-        ['B', 'Satisfactory - Unrestricted long-term operation', '1.12 - 2.8 mm/s'],
-        ['C', 'Alert - Restricted operation', '2.8 - 7.1 mm/s'],
-        ['D', 'Unacceptable - Immediate action required', '> 7.1 mm/s']
-    ]
-    
-    legend_table = Table(severity_legend, colWidths=[40, 200, 100])
-    legend_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 7),
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e293b')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('BACKGROUND', (0, 1), (0, 1), SEVERITY_PDF_COLORS['A']),
-        ('BACKGROUND', (0, 2), (0, 2), SEVERITY_PDF_COLORS['B']),
-        ('BACKGROUND', (0, 3), (0, 3), SEVERITY_PDF_COLORS['C']),
-        ('BACKGROUND', (0, 4), (0, 4), SEVERITY_PDF_COLORS['D']),
-        ('TEXTCOLOR', (0, 1), (0, -1), colors.white),
-        ('BOX', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 3),
-    ]))
-    elements.append(legend_table)
+    elements.extend(_severity_legend_flowables())
     elements.append(Spacer(1, 8*mm))
     
     # ==================== BEARINGS SUMMARY TABLE ====================
@@ -483,8 +906,14 @@ async def generate_pdf_report(
             for axis_key in ['H', 'V', 'A']:
                 axis_data = b.get('axisData', {}).get(axis_key, {})
                 if axis_data.get('available'):
-                    vrms = axis_data.get('velocityRMS', 0)
-                    row.append(f"{vrms:.2f}")
+                    if 'velocityRMSUpperBound' in axis_data:
+                        # FFT was skipped for this quiet axis; show the bound as one,
+                        # rounded up so it stays a bound
+                        bound = math.ceil(axis_data['velocityRMSUpperBound'] * 100) / 100
+                        row.append(f"< {bound:.2f}")
+                    else:
+                        vrms = axis_data.get('velocityRMS', 0)
+                        row.append(f"{vrms:.2f}")
                 else:
                     row.append('-')
             
@@ -535,11 +964,12 @@ async def generate_pdf_report(
             'A': '#f59e0b'   # Orange
         }
         
-        for b in bearings:
-            bearing_name = b.get('bearingName', b.get('bearingId', 'Bearing'))[:40]
-            elements.append(Paragraph(f"Bearing: {bearing_name}", heading_style))
-            elements.append(Spacer(1, 3*mm))
-            
+        # Render every chart up front on the chart thread pool, keyed by
+        # (bearing index, axis), then lay them out in order below
+        loop = asyncio.get_running_loop()
+        chart_keys = []
+        chart_jobs = []
+        for i, b in enumerate(bearings):
             for axis_key in ['H', 'V', 'A']:
                 axis_data = b.get('axisData', {}).get(axis_key, {})
                 
@@ -548,9 +978,23 @@ async def generate_pdf_report(
                     vrms = axis_data.get('velocityRMS', 0)
                     zone = axis_data.get('severity', {}).get('zone', 'A')
                     
-                    # Create chart
                     title = f"{axis_key}-Axis FFT Spectrum (Velocity RMS: {vrms:.2f} mm/s, Zone: {zone})"
-                    chart_buffer = create_fft_chart(fft_spectrum, title, axis_colors[axis_key])
+                    chart_keys.append((i, axis_key))
+                    chart_jobs.append(loop.run_in_executor(
+                        get_chart_pool(), create_fft_chart, fft_spectrum, title, axis_colors[axis_key]
+                    ))
+        chart_buffers = dict(zip(chart_keys, await asyncio.gather(*chart_jobs)))
+        
+        for i, b in enumerate(bearings):
+            bearing_name = b.get('bearingName', b.get('bearingId', 'Bearing'))[:40]
+            elements.append(Paragraph(f"Bearing: {bearing_name}", heading_style))
+            elements.append(Spacer(1, 3*mm))
+            
+            for axis_key in ['H', 'V', 'A']:
+                axis_data = b.get('axisData', {}).get(axis_key, {})
+                
+                if axis_data.get('available'):
+                    chart_buffer = chart_buffers[(i, axis_key)]
                     
                     # Add chart to PDF
                     img = Image(chart_buffer, width=170*mm, height=70*mm)
@@ -564,14 +1008,7 @@ async def generate_pdf_report(
     
     # ==================== FOOTER NOTE ====================
     elements.append(Spacer(1, 10*mm))
-    footer_note = """
-    <para fontSize="7" textColor="#6b7280">
-    Report generated by AAMS Vibration Analysis System. Based on ISO 10816-3:2009/Amd 1:2017 standard.
-    Severity levels are general guidelines and should be interpreted in context of machine-specific conditions.
-    For more information, visit <link href="http://app.aams.io">http://app.aams.io</link>
-    </para>
-    """
-    elements.append(Paragraph(footer_note, normal_style))
+    elements.append(_footer_note_paragraph())
     
     # Build PDF
     doc.build(elements)
@@ -587,8 +1024,9 @@ async def generate_report(
     bearing_id: Optional[str] = None,
     machine_class: str = 'II',
     data_type: str = 'OFFLINE',
-    include_charts: bool = True
-) -> io.BytesIO:
+    include_charts: bool = True,
+    now: Optional[datetime] = None
+) -> BinaryIO:
     """
     Complete report generation pipeline.
     
@@ -600,10 +1038,14 @@ async def generate_report(
         machine_class: ISO machine class
         data_type: ONLINE or OFFLINE
         include_charts: Whether to include FFT charts
+        now: Optional report timestamp (defaults to the current time)
         
     Returns:
-        BytesIO buffer containing PDF
+        Binary file buffer containing PDF (see generate_pdf_report)
     """
+    # One timestamp for the whole report
+    now = now or datetime.now()
+    
     # Prepare data with FFT analysis
     report_data = await prepare_report_data(
         machine_id=machine_id,
@@ -611,7 +1053,10 @@ async def generate_report(
         bearings=bearings,
         bearing_id=bearing_id,
         machine_class=machine_class,
-        data_type=data_type
+        data_type=data_type,
+        now=now,
+        # Without charts the spectrum is never shown, so quiet axes can skip the FFT
+        skip_healthy_fft=not include_charts
     )
     
     # Generate PDF
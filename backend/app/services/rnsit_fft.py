@@ -1,13 +1,18 @@
-import math
+import functools
 import numpy as np
 from scipy import signal
-import scipy.integrate
+import scipy.fft
 
-# Handle scipy version compatibility
-try:
-    from scipy.integrate import cumulative_trapezoid
-except ImportError:
-    from scipy.integrate import cumtrapz as cumulative_trapezoid
+# Thread count for scipy.fft; -1 uses all cores. scipy.fft releases the GIL,
+# and the only shared state here is cached windows and filter coefficients
+# that are never written, so the conversion functions below are safe to call
+# from several threads at once.
+_FFT_WORKERS = -1
+
+def set_fft_workers(workers):
+    # Process-pool workers call this with 1 so they don't oversubscribe the cores
+    global _FFT_WORKERS
+    _FFT_WORKERS = workers
 
 def butter_highpass(cutoff, fs, order=2):
     nyq = 0.5 * fs
@@ -15,24 +20,65 @@ def butter_highpass(cutoff, fs, order=2):
     b, a = signal.butter(order, normal_cutoff, btype='highpass', analog=False)
     return b, a
 
-def butter_highpass_filter(data, cutoff, fs, order=2):
-    b, a = butter_highpass(cutoff, fs, order=order)
-    y = signal.filtfilt(b, a, data)
+@functools.lru_cache(maxsize=64)
+def butter_highpass_sos(cutoff, fs, order=2):
+    # Same filter as butter_highpass in second-order sections, designed once
+    # per (cutoff, fs, order). The array is shared, so never modify it
+    # (it can't be flagged read-only: scipy's sosfilt needs a writable buffer).
+    nyq = 0.5 * fs
+    normal_cutoff = cutoff / nyq
+    return signal.butter(order, normal_cutoff, btype='highpass', analog=False, output='sos')
+
+def butter_highpass_filter(data, cutoff, fs, order=2, axis=-1):
+    sos = butter_highpass_sos(cutoff, fs, order=order)
+    y = signal.sosfiltfilt(sos, data, axis=axis)
     return y
 
+def cumtrapz_uniform(y, dt, out=None):
+    # Cumulative trapezoid integral along the last axis for uniform spacing
+    # dt, starting at 0 (same as cumulative_trapezoid(y, dx=dt, initial=0)).
+    # Builds the result in a single output array (optionally the caller's)
+    # instead of scipy's chain of temporaries.
+    if out is None:
+        out = np.empty_like(y, dtype=np.float64)
+    out[..., 0] = 0
+    np.add(y[..., 1:], y[..., :-1], out=out[..., 1:])
+    np.cumsum(out[..., 1:], axis=-1, out=out[..., 1:])
+    out[..., 1:] *= 0.5 * dt
+    return out
+
 def FFT(temp):
-  N = len(temp)
-  yf = np.fft.fft(temp)
-  yf=2.0/N * np.abs(yf[:N//2])
-  yf[0]=0
+  # Transforms along the last axis, so a 2-D array of blocks is one batched call
+  temp = np.asarray(temp)
+  N = temp.shape[-1]
+  # Real input: rfft gives the same first N//2 bins at half the work
+  yf = scipy.fft.rfft(temp, axis=-1, workers=_FFT_WORKERS)
+  yf=2.0/N * np.abs(yf[..., :N//2])
+  yf[..., 0]=0
   return yf
 
 def hann_data(data):
-    window = signal.windows.hann(len(data))
+    window = _hann_scaled(len(data), 1.0)
     TWS_VALUE = data * window
     return TWS_VALUE
 
-def Velocity_Convert_24_DEMO(rawData, SR, RPM, cutoff, Order, fmax = None,floorNoiseThresholdPercentage = None,floorNoiseAttenuationFactor = None, highResolution = 1, calibrationValue = 1):
+@functools.lru_cache(maxsize=16)
+def _hann_scaled(n, scale):
+    # Hann window with the spectrum's amplitude correction folded in, so the
+    # FFT output needs no extra pass. Read-only because it is shared.
+    window = signal.windows.hann(n) * scale
+    window.setflags(write=False)
+    return window
+
+@functools.lru_cache(maxsize=16)
+def _freq_axis(sr, n):
+    # Frequency bins for an n-point spectrum at sample rate sr; depends only
+    # on (sr, n), so it is built once. Read-only because it is shared.
+    freqs = np.linspace(0.0, sr / 2, num=n)
+    freqs.setflags(write=False)
+    return freqs
+
+def Velocity_Convert_24_DEMO(rawData, SR, RPM, cutoff, Order, fmax = None,floorNoiseThresholdPercentage = None,floorNoiseAttenuationFactor = None, highResolution = 1, calibrationValue = 1, includeTimeseries = True):
 
     if 40000 < len(rawData) < 50000:
         overlappingPercentage = 60
@@ -44,58 +90,82 @@ def Velocity_Convert_24_DEMO(rawData, SR, RPM, cutoff, Order, fmax = None,floorN
     else:
         blockSize = 20000
     
-    velocity_Timeseries_mms2 = np.array(rawData) * 9807
-    N = len(velocity_Timeseries_mms2[0:blockSize])
+    # np.multiply makes the one float64 copy (list or array input alike, the
+    # caller's data is never modified); the mean comes off in place. Kept in
+    # float64 since the series is integrated below.
+    velocity_Timeseries_mms2 = np.multiply(rawData, 9807.0, dtype=np.float64)
     time_step = 1 / SR
-    time = np.linspace(0.0, N*time_step, N)
-
-    velocity_Timeseries_mms2 = velocity_Timeseries_mms2 - np.mean(velocity_Timeseries_mms2)
-    velocity_Timeseries = cumulative_trapezoid(velocity_Timeseries_mms2, x=np.linspace(0.0, len(velocity_Timeseries_mms2)*time_step, len(velocity_Timeseries_mms2)), initial=0)
-
-    rms_cutoff_value = max((RPM/60) * 0.6, 4)
 
-    rms_cutoff_value = math.ceil(rms_cutoff_value)
-    # rms_cutoff_value = max(rms_cutoff_value, cutoff)
-    rms_cutoff_value  = cutoff
-
-    final_velocity_Timeseries = butter_highpass_filter(velocity_Timeseries,rms_cutoff_value,10000,2)
-    velocity_FFT_Data_list = []
-    for i in range(4):
-        start = int(i * (1 - (overlappingPercentage / 100)) * blockSize)
-        end = start + blockSize
-
-        velocity_Timeseries_i = cumulative_trapezoid(velocity_Timeseries_mms2[start:end], x=time, initial=0)
-        velocity_Timeseries_i = butter_highpass_filter(velocity_Timeseries_i, rms_cutoff_value, 10000, 2 )
-        velocity_FFT_Data_i = ((FFT(hann_data(velocity_Timeseries_i)))) * 2
-        velocity_FFT_Data_list.append(velocity_FFT_Data_i)
-        
-    velocity_FFT_Data = sum(velocity_FFT_Data_list) / len(velocity_FFT_Data_list)
-
-    velocity_FFT_X_Data = np.linspace(0.0, SR / 2, num=int(len(velocity_FFT_Data)))
+    velocity_Timeseries_mms2 -= velocity_Timeseries_mms2.mean()
+
+    rms_cutoff_value = cutoff
+
+    # The FFT comes only from the blocks below; the full-length integrate +
+    # filter pass just produces the TWF, so callers that don't need it skip it.
+    if includeTimeseries:
+        velocity_Timeseries = cumtrapz_uniform(velocity_Timeseries_mms2, time_step)
+        final_velocity_Timeseries = butter_highpass_filter(velocity_Timeseries,rms_cutoff_value,10000,2)
+
+    # Integrate the 4 overlapping blocks straight from the series into the
+    # rows of one (4, blockSize) array, so filtering runs once over all of
+    # them. (The starts are not always evenly spaced, e.g. 0, 3999, 7999, ...)
+    starts = [int(i * (1 - (overlappingPercentage / 100)) * blockSize) for i in range(4)]
+    velocity_blocks = np.empty((len(starts), blockSize))
+    for velocity_block, start in zip(velocity_blocks, starts):
+        cumtrapz_uniform(velocity_Timeseries_mms2[start:start + blockSize], time_step, out=velocity_block)
+    velocity_blocks = butter_highpass_filter(velocity_blocks, rms_cutoff_value, 10000, 2, axis=1)
+
+    # Window and FFT in float32: ~1e-7 relative error, half the memory
+    # traffic. Integration and the 4 Hz highpass (poles right next to the unit
+    # circle at fs=10 kHz) stay float64, where float32 would show up in the RMS.
+    velocity_blocks = velocity_blocks.astype(np.float32)
+    velocity_blocks *= _hann_scaled(blockSize, 2.0)
+
+    # One batched FFT over all blocks, averaged in float64
+    velocity_FFT_Data = FFT(velocity_blocks).sum(axis=0, dtype=np.float64)
+    velocity_FFT_Data /= len(velocity_blocks)
+
+    velocity_FFT_X_Data = _freq_axis(SR, len(velocity_FFT_Data))
+    # Noise floor, cutoff attenuation and calibration as one per-bin gain,
+    # applied to the spectrum in a single pass
     if floorNoiseThresholdPercentage not in (None, 0) and floorNoiseAttenuationFactor not in (None, 0):
-        velocity_FFT_Data = np.where(velocity_FFT_Data < (np.max(velocity_FFT_Data) * floorNoiseThresholdPercentage), velocity_FFT_Data / floorNoiseAttenuationFactor, velocity_FFT_Data)
+        noise_mask = velocity_FFT_Data < (velocity_FFT_Data.max() * floorNoiseThresholdPercentage)
+        gain = np.where(noise_mask, 1 / floorNoiseAttenuationFactor, 1.0)
     else:
-        velocity_FFT_Data = np.where(velocity_FFT_Data < (np.max(velocity_FFT_Data)*0.05), velocity_FFT_Data/1.1, velocity_FFT_Data)
-        
-    velocity_FFT_Data[:int(np.where(velocity_FFT_X_Data > rms_cutoff_value)[0][0])] *= 0.2
-    
-    velocity_FFT_Data[:int(np.where(velocity_FFT_X_Data > (rms_cutoff_value * .75))[0][0])] *= 0.05
-
-    Velocity_FFT_Data = np.round(velocity_FFT_Data,8)
-    Velocity_FFT_Data = Velocity_FFT_Data * calibrationValue
+        noise_mask = velocity_FFT_Data < (velocity_FFT_Data.max() * 0.05)
+        gain = np.where(noise_mask, 1 / 1.1, 1.0)
+
+    # velocity_FFT_X_Data is sorted, so the first bin above a frequency is a
+    # binary search. Searching the actual bins (rather than dividing by the
+    # bin width) keeps exact-multiple cutoffs on the same side as before.
+    # Bins up to 75% of the cutoff get both the 0.2 and the 0.05 reduction.
+    cutoff_idx = np.searchsorted(velocity_FFT_X_Data, rms_cutoff_value, side='right')
+    cutoff_75_idx = np.searchsorted(velocity_FFT_X_Data, rms_cutoff_value * .75, side='right')
+    gain[:cutoff_75_idx] *= 0.2 * 0.05
+    gain[cutoff_75_idx:cutoff_idx] *= 0.2
+
+    gain *= calibrationValue
+    np.multiply(velocity_FFT_Data, gain, out=velocity_FFT_Data)
+    Velocity_FFT_Data = velocity_FFT_Data
 
     if fmax != None:
         filtered_indices = velocity_FFT_X_Data < fmax
-        Final_Velocity_FFT_Data = list(zip(velocity_FFT_X_Data[filtered_indices], Velocity_FFT_Data[filtered_indices]))
+        velocity_FFT_X_Data = velocity_FFT_X_Data[filtered_indices]
+        Velocity_FFT_Data = Velocity_FFT_Data[filtered_indices]
 
-    else:
-        Final_Velocity_FFT_Data = list(zip(velocity_FFT_X_Data,Velocity_FFT_Data))
+    # Pair up columns in NumPy and convert to nested lists in one C-level pass
+    Final_Velocity_FFT_Data = np.column_stack((velocity_FFT_X_Data, Velocity_FFT_Data)).tolist()
 
-    v1 = (len(final_velocity_Timeseries)/SR) / len(final_velocity_Timeseries)
-    final_Timeseries_Data = np.round(final_velocity_Timeseries,8)
-    Final_Velocity_Temp_Data = [ [(i * v1), final_Timeseries_Data[i]] for i in range(len(final_Timeseries_Data))]
+    if includeTimeseries:
+        Final_Velocity_Temp_Data = np.column_stack((np.arange(len(final_velocity_Timeseries)) * time_step, final_velocity_Timeseries)).tolist()
+        twf_min, twf_max = Final_Velocity_Temp_Data[0][0], Final_Velocity_Temp_Data[-1][0]
+    else:
+        Final_Velocity_Temp_Data = []
+        twf_min = twf_max = None
 
-    return { "SR": SR, "twf_min": Final_Velocity_Temp_Data[0][0], "twf_max": Final_Velocity_Temp_Data[-1][0], "Timeseries": Final_Velocity_Temp_Data, "fft_min": Final_Velocity_FFT_Data[0][0], "fft_max": Final_Velocity_FFT_Data[-1][0], "FFT": Final_Velocity_FFT_Data }  
+    # "_freqs_arr"/"_amps_arr" carry the same spectrum as "FFT" as ndarrays for
+    # in-process callers; they are not part of the JSON payload.
+    return { "SR": SR, "twf_min": twf_min, "twf_max": twf_max, "Timeseries": Final_Velocity_Temp_Data, "fft_min": Final_Velocity_FFT_Data[0][0], "fft_max": Final_Velocity_FFT_Data[-1][0], "FFT": Final_Velocity_FFT_Data, "_freqs_arr": velocity_FFT_X_Data, "_amps_arr": Velocity_FFT_Data }  
 
 def Acceleration_Convert_32_DEMO(Data, SR, fmax = None):
     Acceleration_Timeseries_Data =  np.array(Data)
@@ -104,21 +174,22 @@ def Acceleration_Convert_32_DEMO(Data, SR, fmax = None):
     Filter_Order = 4
 
     first_filter_data = butter_highpass_filter(Acceleration_Timeseries_Data, Filter_Cutoff, SR, Filter_Order)
-    Acceleration_FFT_Data = (FFT(hann_data(first_filter_data)) * 0.707) * 2.1
+    first_filter_data = first_filter_data.astype(np.float32)
+    first_filter_data *= _hann_scaled(len(first_filter_data), 0.707 * 2.1)
+    Acceleration_FFT_Data = FFT(first_filter_data)
 
-    Acceleration_FFT_X_Data = np.linspace(0.0, SR / 2, num=int(len(Acceleration_FFT_Data)))
+    Acceleration_FFT_X_Data = _freq_axis(SR, len(Acceleration_FFT_Data))
     
     if fmax != None:
         filtered_indices = Acceleration_FFT_X_Data < fmax
-        Final_Acceleration_FFT_Data = list(zip(Acceleration_FFT_X_Data[filtered_indices], Acceleration_FFT_Data[filtered_indices]))
+        Final_Acceleration_FFT_Data = np.column_stack((Acceleration_FFT_X_Data[filtered_indices], Acceleration_FFT_Data[filtered_indices])).tolist()
 
     else:
-        Final_Acceleration_FFT_Data = list(zip(Acceleration_FFT_X_Data,Acceleration_FFT_Data))
+        Final_Acceleration_FFT_Data = np.column_stack((Acceleration_FFT_X_Data, Acceleration_FFT_Data)).tolist()
 
     Acceleration_Timeseries_Data = Acceleration_Timeseries_Data[int(len(Acceleration_Timeseries_Data)*0.1):]
 
-    v1 = (len(Acceleration_Timeseries_Data)/SR) / len(Acceleration_Timeseries_Data)
-    Temp_Acceleration_Temp = Acceleration_Timeseries_Data
-    Final_Acceleration_Timeseries_Data = [[i * v1, Acceleration_Timeseries_Data[i]] for i in range(len(Temp_Acceleration_Temp))]
+    time_step = 1 / SR
+    Final_Acceleration_Timeseries_Data = np.column_stack((np.arange(len(Acceleration_Timeseries_Data)) * time_step, Acceleration_Timeseries_Data)).tolist()
 
     return { "SR": SR, "twf_min": Final_Acceleration_Timeseries_Data[0][0], "twf_max": Final_Acceleration_Timeseries_Data[-1][0], "Timeseries": Final_Acceleration_Timeseries_Data, "fft_min": Final_Acceleration_FFT_Data[0][0], "fft_max": Final_Acceleration_FFT_Data[-1][0], "FFT": Final_Acceleration_FFT_Data }
@@ -1,12 +1,17 @@
 """Extract velocity values from BearingLocation API"""
+import asyncio
 import httpx
 import json
 
 url = "https://srcapiv2.aams.io/AAMS/AI/BearingLocation"
 payload = {"machineId": "664dbfaf5c3f971b7253a319"}
 
-response = httpx.post(url, json=payload, timeout=30)
-data = response.json()
+async def fetch_bearings():
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        response = await client.post(url, json=payload)
+        return response.json()
+
+data = asyncio.run(fetch_bearings())
 
 bearings = data if isinstance(data, list) else data.get('data', [])
 
@@ -1,5 +1,7 @@
 """Test script for FFT analysis"""
+import asyncio
 import httpx
+import numpy as np
 from app.services.fft_analysis import perform_complete_analysis
 
 # Fetch real data from API
@@ -12,15 +14,19 @@ payload = {
     'Analytics_Types': 'MF'
 }
 
+async def fetch_data():
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        response = await client.post(url, json=payload)
+        return response.json()
+
 print("Fetching data from API...")
-response = httpx.post(url, json=payload, timeout=30)
-data = response.json()
+data = asyncio.run(fetch_data())
 print(f"RPM: {data.get('rpm')}")
 print(f"SR: {data.get('SR')}")
 print(f"rawData length: {len(data.get('rawData', []))}")
 
 # Convert all values to float
-raw_data = [float(x) for x in data['rawData']]
+raw_data = np.asarray(data['rawData'], dtype=np.float64)
 print(f"Converted data length: {len(raw_data)}")
 print(f"First value: {raw_data[0]}, type: {type(raw_data[0])}")
 
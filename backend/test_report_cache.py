@@ -0,0 +1,85 @@
+"""Test the report service's fetch cache with overlapping and cancelled callers"""
+import asyncio
+import sys
+sys.path.insert(0, '.')
+
+import httpx
+
+from app.services.report_service import _async_ttl_cache
+
+
+class FakeClient:
+    """Stands in for a report's httpx client; closed when its report ends"""
+    def __init__(self):
+        self.closed = False
+
+
+def make_fetch():
+    calls = []
+
+    @_async_ttl_cache(ttl=60, maxsize=8)
+    async def fetch(key, client=None):
+        calls.append(client)
+        await asyncio.sleep(0.05)
+        if client is not None and client.closed:
+            raise httpx.ReadError("client has been closed")
+        return {'key': key}
+
+    return fetch, calls
+
+
+async def report(fetch, key, client):
+    """Fetch with the report's client, closing it however the report ends"""
+    try:
+        return await fetch(key, client=client)
+    finally:
+        client.closed = True
+
+
+def test_cancelled_caller_does_not_fail_overlapping_caller():
+    async def run():
+        fetch, calls = make_fetch()
+        report_a = asyncio.create_task(report(fetch, 'bearing-1', FakeClient()))
+        await asyncio.sleep(0.01)
+        report_b = asyncio.create_task(report(fetch, 'bearing-1', FakeClient()))
+        await asyncio.sleep(0.01)
+
+        report_a.cancel()
+        assert await report_b == {'key': 'bearing-1'}
+        assert len(calls) == 2  # B did not share A's in-flight request
+
+        # The finished result is shared regardless of client
+        assert await fetch('bearing-1', client=FakeClient()) == {'key': 'bearing-1'}
+        assert len(calls) == 2
+
+    asyncio.run(run())
+
+
+def test_same_client_callers_share_request_until_all_cancelled():
+    async def run():
+        fetch, calls = make_fetch()
+        client = FakeClient()
+        first = asyncio.create_task(fetch('bearing-1', client=client))
+        second = asyncio.create_task(fetch('bearing-1', client=client))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        assert await second == {'key': 'bearing-1'}
+        assert len(calls) == 1
+
+        # Once every caller is cancelled the shared request is cancelled too
+        # and nothing is cached
+        other = asyncio.create_task(fetch('bearing-2', client=client))
+        await asyncio.sleep(0.01)
+        other.cancel()
+        await asyncio.sleep(0)
+        assert await fetch('bearing-2', client=client) == {'key': 'bearing-2'}
+        assert len(calls) == 3
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    test_cancelled_caller_does_not_fail_overlapping_caller()
+    test_same_client_callers_share_request_until_all_cancelled()
+    print("Fetch cache tests passed")
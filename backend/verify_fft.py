@@ -4,11 +4,17 @@ FFT Verification Script - Compare our FFT output with raw data
 This script fetches real vibration data from the API and performs FFT analysis,
 allowing you to verify the calculations are correct.
 """
+import asyncio
 import httpx
 import numpy as np
 import json
 from app.services.fft_analysis import perform_complete_analysis
 
+async def fetch_data(url, payload):
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        response = await client.post(url, json=payload)
+        return response.json()
+
 def verify_fft_analysis():
     # Fetch real data from API
     url = 'https://srcapiv2.aams.io/AAMS/AI/Data'
@@ -27,12 +33,11 @@ def verify_fft_analysis():
     print("=" * 60)
     
     print("\n1. FETCHING DATA FROM EXTERNAL API...")
-    response = httpx.post(url, json=payload, timeout=30)
-    data = response.json()
+    data = asyncio.run(fetch_data(url, payload))
     
     rpm = float(data['rpm'])
     sr = float(data['SR'])
-    raw_data = [float(x) for x in data['rawData']]
+    raw_data = np.asarray(data['rawData'], dtype=np.float64)
     
     print(f"   - RPM from API: {rpm}")
     print(f"   - Sample Rate: {sr} Hz")
@@ -90,7 +95,7 @@ def verify_fft_analysis():
     # Do our own FFT to compare
     n = len(raw_data)
     window = np.hanning(n)
-    windowed = np.array(raw_data) * window
+    windowed = raw_data * window
     fft_result = np.fft.rfft(windowed)
     freqs = np.fft.rfftfreq(n, d=1.0/sr)
     amplitudes = np.abs(fft_result) / n * 2